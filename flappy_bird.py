@@ -2,12 +2,167 @@ import random
 import pygame
 import pygame.freetype
 import json
+from dataclasses import dataclass, fields
+from typing import Optional
+
+try:
+    import numpy as np
+except ImportError:  # Без NumPy высоты стен берутся из random, а стены обрабатываются поштучно
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # Без Numba стены обрабатываются поштучно
+    njit = None
+
+# Ядра ниже компилируются только при наличии Numba и NumPy, иначе остаются обычными функциями
+HAS_NUMBA = njit is not None and np is not None
+jit = njit(cache=True, fastmath=True) if HAS_NUMBA else (lambda func: func)
+
+# pygame-ce умеет fblits: пакетная отрисовка без возврата списка прямоугольников
+HAS_FBLITS = hasattr(pygame.Surface, 'fblits')
+
+# Начальная ёмкость массивов состояния стен (при нехватке удваивается)
+MAX_WALL_PAIRS = 16
+
+# Сколько случайных высот стен генерируется за один вызов NumPy
+WALL_HEIGHT_POOL_SIZE = 4096
+
+# Вертикальная позиция и скорость птицы хранятся в фиксированной точке: 1 пиксель = 65536
+FP_SHIFT = 16
+FP_ONE = 1 << FP_SHIFT
+FP_HALF = FP_ONE >> 1
+
+
+@jit
+def to_pixel(x):
+    # Округление координаты до пикселя так же, как pygame.Rect (половина — от нуля)
+    return int(x + 0.5) if x >= 0 else -int(0.5 - x)
+
+
+@jit
+def fp_to_pixel(value_fp):
+    # Фиксированная точка -> ближайший целый пиксель
+    return (value_fp + FP_HALF) >> FP_SHIFT
+
+
+@jit
+def bird_step(y_fp, speed_fp, gravity_fp):
+    # Один шаг падения птицы (общий для Bird.update и tick)
+    speed_fp += gravity_fp
+    y_fp += speed_fp
+    return y_fp, speed_fp
+
+
+@jit
+def bird_bounds(y_fp, speed_fp, bird_h, screen_height):
+    # Удержание птицы в пределах экрана (общее для Bird.check_bounds и tick).
+    # Возвращает новые y и скорость, верх птицы в пикселях и упала ли она вниз
+    bird_y = fp_to_pixel(y_fp)
+    hit_top = bird_y <= 0
+    fell = bird_y + bird_h >= screen_height
+    if hit_top or fell:
+        bird_y = 0 if hit_top else screen_height - bird_h
+        y_fp = bird_y << FP_SHIFT
+        speed_fp = 0
+    return y_fp, speed_fp, bird_y, fell
+
+
+@jit
+def tick_walls(wall_x, wall_left, wall_top_h, wall_passed, wall_active, speed,
+               bird_x, bird_y, bird_w, bird_h, wall_w, wall_h, gap):
+    # Один шаг стен: движение, столкновения, прохождение и уход за экран.
+    # В wall_left записывается x стены в пикселях для её прямоугольника.
+    # Возвращает (было ли столкновение, сколько пар пройдено, маска ушедших пар)
+    collided = False
+    scored = 0
+    offscreen = np.zeros(wall_x.shape[0], np.bool_)
+    for i in range(wall_x.shape[0]):
+        if not wall_active[i]:
+            continue
+        wall_x[i] -= speed
+        left = to_pixel(wall_x[i])  # Сравнение идёт с тем же x, что у нарисованной стены
+        wall_left[i] = left
+        right = left + wall_w
+        top_h = wall_top_h[i]
+        bottom_y = top_h + gap
+        if bird_x < right and bird_x + bird_w > left:
+            if bird_y < top_h and bird_y + bird_h > top_h - wall_h:
+                collided = True
+            if bird_y < bottom_y + wall_h and bird_y + bird_h > bottom_y:
+                collided = True
+        if not wall_passed[i] and right < bird_x:
+            wall_passed[i] = True
+            scored += 1
+        if right < 0:
+            offscreen[i] = True
+    return collided, scored, offscreen
+
+
+@jit
+def tick(bird_y_fp, bird_speed_fp, gravity_fp, bird_x, bird_w, bird_h, screen_height,
+         wall_x, wall_left, wall_top_h, wall_passed, wall_active, speed, wall_w, wall_h, gap):
+    # Полный шаг игры: птица, затем стены.
+    # Возвращает результат bird_bounds и результат tick_walls
+    bird_y_fp, bird_speed_fp = bird_step(bird_y_fp, bird_speed_fp, gravity_fp)
+    bird_y_fp, bird_speed_fp, bird_y, fell = bird_bounds(bird_y_fp, bird_speed_fp, bird_h, screen_height)
+
+    collided, scored, offscreen = tick_walls(
+        wall_x, wall_left, wall_top_h, wall_passed, wall_active, speed,
+        bird_x, bird_y, bird_w, bird_h, wall_w, wall_h, gap
+    )
+    return bird_y_fp, bird_speed_fp, bird_y, fell, collided, scored, offscreen
+
+
+@dataclass
+class GameSettings:  # Секция game_settings
+    window_width: int = 600
+    window_height: int = 500
+    fps: int = 60
+    font_name: Optional[str] = None
+    font_size: int = 36
+
+
+@dataclass
+class BirdSettings:  # Секция bird_settings
+    start_x: int = 100
+    start_y: Optional[int] = None  # По умолчанию середина окна
+    width: int = 60
+    height: int = 35
+    gravity: float = 0.4
+    jump_strength: float = -6
+    image_path: str = 'bird.png'
+
+
+@dataclass
+class WallSettings:  # Секция wall_settings
+    width: int = 100
+    height: int = 500
+    speed: float = 2
+    spawn_interval: int = 1500
+    gap_height: int = 200
+    min_height: int = 100
+    max_height: int = 400
+    image_path: str = 'wall.png'
+
+
+@dataclass
+class TextSettings:  # Секция texts
+    score_prefix: str = 'Score: '
+    game_over: str = 'GAME OVER'
+    restart_instruction: str = 'Press SPACE to restart'
 
 
 class Config:
     def __init__(self, config_path='bird_config.json'):
         self.config_path = config_path
-        self.data = self.load_config()
+        data = self.load_config()
+
+        # Секции разбираются один раз; отсутствующие ключи получают значения по умолчанию
+        self.game = self.parse_section(data, 'game_settings', GameSettings)
+        self.bird = self.parse_section(data, 'bird_settings', BirdSettings)
+        self.wall = self.parse_section(data, 'wall_settings', WallSettings)
+        self.texts = self.parse_section(data, 'texts', TextSettings)
 
     def load_config(self):
         try:
@@ -17,11 +172,17 @@ class Config:
             print('Конфигурационный файл не найден')
             return {}
 
-    def get(self, key):
-        return self.data.get(key, {})
+    @staticmethod
+    def parse_section(data, key, section_class):
+        section = data.get(key, {})
+        known = {field.name for field in fields(section_class)}
+        return section_class(**{name: value for name, value in section.items() if name in known})
 
 
 class GameObject:  # Базовый класс для всех игровых объектов
+    # Подготовленные изображения: (путь, ширина, высота) -> Surface
+    _surface_cache = {}
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -35,6 +196,17 @@ class GameObject:  # Базовый класс для всех игровых о
         if self.image and self.rect:
             surface.blit(self.image, self.rect)
 
+    @staticmethod
+    def load_image(image_path, width, height):
+        # Загрузка и масштабирование выполняются один раз на набор параметров
+        key = (image_path, width, height)
+        image = GameObject._surface_cache.get(key)
+        if image is None:
+            image = pygame.image.load(image_path).convert_alpha()
+            image = pygame.transform.scale(image, (width, height))
+            GameObject._surface_cache[key] = image
+        return image
+
 
 class MovingObject(GameObject):  # Класс для движущихся объектов
     def __init__(self, x, y):
@@ -54,131 +226,118 @@ class MovingObject(GameObject):  # Класс для движущихся объ
 class Bird(MovingObject):  # Класс птицы
     def __init__(self, x, y, config):
         super().__init__(x, y)
-        bird_config = config.get('bird_settings')
-        self.gravity = bird_config.get('gravity', 0.4)
-        self.jump_strength = bird_config.get("jump_strength", -6)
-        image_path = bird_config.get("image_path", "bird.png")
-        self.width = bird_config.get("width", 60)
-        self.height = bird_config.get("height", 35)
-        self.speed_y = 0
-
-        # Загрузка и масштабирование изображения
-        self.image = pygame.image.load(image_path).convert_alpha()
-        self.image = pygame.transform.scale(self.image, (self.width, self.height))
+        bird_config = config.bird
+        self.gravity = bird_config.gravity
+        self.jump_strength = bird_config.jump_strength
+        image_path = bird_config.image_path
+        self.width = bird_config.width
+        self.height = bird_config.height
+
+        # Целочисленные величины для update: без преобразований float -> int в каждом кадре
+        self.gravity_fp = round(self.gravity * FP_ONE)
+        self.jump_strength_fp = round(self.jump_strength * FP_ONE)
+        self.speed_y_fp = 0
+
+        # Загрузка и масштабирование изображения (из кэша)
+        self.image = self.load_image(image_path, self.width, self.height)
         self.rect = self.image.get_rect(center=(x, y))
 
+    @property
+    def y(self):
+        return self.y_fp / FP_ONE
+
+    @y.setter
+    def y(self, value):
+        self.y_fp = round(value * FP_ONE)
+
     def update(self):
-        # Применяем гравитацию
-        self.speed_y += self.gravity
-        self.y += self.speed_y
-        self.rect.y = self.y
+        # Применяем гравитацию (с округлением до ближайшего пикселя)
+        self.y_fp, self.speed_y_fp = bird_step(self.y_fp, self.speed_y_fp, self.gravity_fp)
+        self.rect.y = fp_to_pixel(self.y_fp)
 
     def jump(self):  # делает прыжок
-        self.speed_y = self.jump_strength
+        self.speed_y_fp = self.jump_strength_fp
 
     def check_bounds(self, screen_height):
-        # Проверка границ экрана
-        if self.rect.top <= 0:
-            self.rect.top = 0
-            self.y = 0
-            self.speed_y = 0
-            return 'top'
-        elif self.rect.bottom >= screen_height:
-            self.rect.bottom = screen_height
-            self.y = screen_height - self.rect.height
-            return 'bottom'
-        return None
+        # Проверка границ экрана: 1, если птица упала вниз, иначе 0
+        rect = self.rect
+        self.y_fp, self.speed_y_fp, rect.y, fell = bird_bounds(
+            self.y_fp, self.speed_y_fp, rect.height, screen_height
+        )
+        return int(fell)
 
 
 class Wall(GameObject):  # Класс отдельной стены
-    def __init__(self, x, y, config, flip=False):
+    def __init__(self, x, y, config, images, flip=False):
         super().__init__(x, y)
-        # Загрузка и подготовка изображения
-        wall_config = config.get("wall_settings")
-        self.speed = wall_config.get("speed", 2)
-        width = wall_config.get("width", 100)
-        height = wall_config.get("height", 500)
-
-        image_path = wall_config.get("image_path", "wall.png")
-        self.image = pygame.image.load(image_path).convert_alpha()
-        self.image = pygame.transform.scale(self.image, (width, height))
-        if flip:
-            self.image = pygame.transform.flip(self.image, False, True)
+        # images — заранее подготовленная пара (обычное, отражённое) изображение
+        self.speed = config.wall.speed
+        self.image = images[1] if flip else images[0]
 
         self.rect = self.image.get_rect()
-        if flip:
+        self.flip = flip
+        self.reset(x, y)
+
+    def reset(self, x, y):
+        # Установка позиции (используется и при повторном использовании стены)
+        self.x = x
+        self.y = y
+        if self.flip:
             self.rect.bottomleft = (x, y)  # Верхняя стена
         else:
             self.rect.topleft = (x, y)  # Нижняя стена
 
-        self.passed = False
-        self.flip = flip
-
     def update(self):
         # Движение стены влево
-        self.x -= self.speed
-        self.rect.x = self.x
-
-    def is_offscreen(self):  # проверка ухода за экран
-        # Проверка, ушла ли стена за экран
-        return self.rect.right < 0
-
-    def check_collision(self, bird_rect):
-        # Проверка столкновения с птицей
-        return self.rect.colliderect(bird_rect)
-
-    def check_pass(self, bird_rect):
-        # Проверка, прошла ли птица стену
-        if not self.passed and self.rect.right < bird_rect.left:
-            self.passed = True
-            return True
-        return False
+        x = self.x - self.speed
+        self.x = x
+        self.rect.x = to_pixel(x)
 
 
 class WallPair:  # Класс пары стен (верхняя + нижняя)
-    def __init__(self, x, screen_height, config):  # Управляет двумя стенами как единым объектом
-        wall_config = config.get('wall_settings')
-        self.gap_height = wall_config.get("gap_height", 200)
-        self.min_height = wall_config.get("min_height", 100)
-        self.max_height = wall_config.get("max_height", 400)
-
-        # Случайная высота для стен
-        self.wall_height = random.randint(self.min_height, self.max_height)
+    def __init__(self, x, wall_height, screen_height, config, images, slot=None):  # Управляет двумя стенами как единым объектом
+        self.slot = slot  # Индекс пары в массивах состояния стен Game
+        self.gap_height = config.wall.gap_height
         self.screen_height = screen_height
 
         # Создание верхней стены
-        self.top_wall = Wall(x, self.wall_height, config, flip=True)
+        self.top_wall = Wall(x, 0, config, images, flip=True)
 
         # Создание нижней стены
-        self.bottom_wall = Wall(x, self.wall_height + self.gap_height, config, flip=False)
+        self.bottom_wall = Wall(x, self.gap_height, config, images, flip=False)
 
         self.walls = [self.top_wall, self.bottom_wall]
+
+        # Прямоугольники стен не пересоздаются, поэтому ссылки на них можно хранить
+        self.top_rect = self.top_wall.rect
+        self.bottom_rect = self.bottom_wall.rect
+        self.sprites = ((self.top_wall.image, self.top_rect), (self.bottom_wall.image, self.bottom_rect))
+        self.reset(x, wall_height)
+
+    def reset(self, x, wall_height):  # Новая высота и позиция (для пула пар стен)
+        self.wall_height = wall_height
+        self.top_wall.reset(x, self.wall_height)
+        self.bottom_wall.reset(x, self.wall_height + self.gap_height)
         self.scored = False
 
     def update(self):
-        for wall in self.walls:
-            wall.update()
+        self.top_wall.update()
+        self.bottom_wall.update()
 
     def draw(self, surface):
         for wall in self.walls:
             wall.draw(surface)
 
-    def check_collisions(self, bird_rect):
-        for wall in self.walls:
-            if wall.check_collision(bird_rect):
-                return True
-        return False
-
     def check_pass(self, bird_rect):
-        if not self.scored:
-            for wall in self.walls:
-                if not wall.passed and wall.check_pass(bird_rect):
-                    self.scored = True
-                    return True
+        # Обе стены пары имеют одинаковый x, поэтому достаточно верхней
+        if not self.scored and self.top_rect.right < bird_rect.left:
+            self.scored = True
+            return True
         return False
 
     def is_offscreen(self):
-        return all(wall.is_offscreen() for wall in self.walls)
+        # Обе стены пары имеют одинаковый x
+        return self.top_rect.right < 0
 
 
 class Game:  # Главный класс, управляющий всей игрой
@@ -187,143 +346,297 @@ class Game:  # Главный класс, управляющий всей игр
         pygame.init()
 
         # Настройки окна
-        game_settings = self.config.get('game_settings')
-        self.width = game_settings.get('window_width', 600)
-        self.height = game_settings.get('window_height', 500)
-        self.screen = pygame.display.set_mode((self.width, self.height))
+        game_settings = self.config.game
+        self.width = game_settings.window_width
+        self.height = game_settings.window_height
+        self.screen = pygame.display.set_mode((self.width, self.height), pygame.DOUBLEBUF)
         pygame.display.set_caption('Flappy Bird')
 
         # Частота кадров
         self.clock = pygame.time.Clock()
-        self.fps = game_settings.get('fps', 60)
+        self.fps = game_settings.fps
 
-        # Загрузка фона
-        self.bg = pygame.image.load('bg.jpg').convert()
-        self.bg = pygame.transform.scale(self.bg, (self.width, self.height))
+        # Загрузка фона: после масштабирования приводится к формату экрана,
+        # чтобы при отрисовке не было преобразования пикселей
+        self.bg = pygame.image.load('bg.jpg')
+        self.bg = pygame.transform.scale(self.bg, (self.width, self.height)).convert(self.screen)
 
-        # Игровые объекты
-        bird_config = self.config.get('bird_settings')
-        start_x = bird_config.get('start_x', 100)
-        start_y = bird_config.get('start_y', self.height // 2)
+        # Изменившиеся области экрана: в первом кадре обновляется весь экран
+        self.screen_rect = self.screen.get_rect()
+        self._dirty = []
+        self.invalidate_screen()
 
-        self.bird = Bird(start_x, start_y, self.config)
+        # Игровые объекты
+        self.bird = self.create_bird()
         self.wall_pairs = []
+        self._wall_pool = []  # Ушедшие за экран пары стен для повторного использования
+        self._wall_pair_count = 0  # Сколько пар создано; номер следующей = её индекс в массивах
 
         # Таймер для создания стен
-        wall_config = self.config.get('wall_settings')
-        spawn_interval = wall_config.get('spawn_interval', 1500)
+        wall_config = self.config.wall
+        spawn_interval = wall_config.spawn_interval
+
+        # Изображение стены в обоих вариантах готовится один раз при запуске
+        wall_image = GameObject.load_image(wall_config.image_path, wall_config.width, wall_config.height)
+        self.wall_images = (wall_image, pygame.transform.flip(wall_image, False, True))
+
+        # Состояние стен в виде массивов для скомпилированного шага (по одному элементу на пару)
+        self.wall_speed = wall_config.speed
+        self.wall_width = wall_config.width
+        self.wall_full_height = wall_config.height
+        self.wall_gap = wall_config.gap_height
+        self._height_pool = []  # Заполняется при первом появлении стены
+        self._height_idx = 0
+        if HAS_NUMBA:
+            self.wall_x = np.zeros(MAX_WALL_PAIRS, np.float64)
+            self.wall_left = np.zeros(MAX_WALL_PAIRS, np.int64)
+            self.wall_top_h = np.zeros(MAX_WALL_PAIRS, np.int32)
+            self.wall_passed = np.zeros(MAX_WALL_PAIRS, bool)
+            self.wall_active = np.zeros(MAX_WALL_PAIRS, bool)
+            if HAS_NUMBA:
+                # Компиляция при запуске, а не при появлении первой стены
+                # (стен ещё нет, а результат для птицы отбрасывается)
+                self._tick_jit()
 
         self.spawn_wall_event = pygame.USEREVENT
         pygame.time.set_timer(self.spawn_wall_event, spawn_interval)
 
+        # Окно, открывшееся после перекрытия или сворачивания, перерисовывается целиком
+        self.expose_events = [pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED]
+
+        # В очередь попадают только нужные игре события (движения мыши и пр. отбрасываются)
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, self.spawn_wall_event] + self.expose_events)
+
         # Состояние игры
         self.game_status = 'game'  # 'game' или 'menu'
         self.score = 0
 
         # Шрифт
-        font_name = game_settings.get("font_name", None)
-        font_size = game_settings.get("font_size", 36)
-        self.font = pygame.freetype.Font(font_name, font_size)
+        self.font = pygame.freetype.Font(game_settings.font_name, game_settings.font_size)
 
         # Тексты
-        texts = self.config.get("texts")
-        self.score_text = texts.get("score_prefix", "Score: ")
-        self.game_over_text = texts.get("game_over", "GAME OVER")
-        self.restart_text = texts.get("restart_instruction", "Press SPACE to restart")
+        texts = self.config.texts
+        self.score_text = texts.score_prefix
+        self.game_over_text = texts.game_over
+        self.restart_text = texts.restart_instruction
+
+        # Отрисованные тексты: счёт по значению, надписи экрана проигрыша один раз
+        self._score_surf_cache = {}
+        self._static_surfs = {
+            'game_over': (
+                self.font.render(self.game_over_text, (255, 0, 0))[0],
+                (self.width // 2 - 120, self.height // 2 - 50)
+            ),
+            'restart': (
+                self.font.render(self.restart_text, (255, 255, 255))[0],
+                (self.width // 2 - 200, self.height // 2 + 50)
+            ),
+        }
+        self._menu_score_pos = (self.width // 2 - 100, self.height // 2)
 
         # Флаг работы игры
         self.running = True
 
+    def invalidate_screen(self):
+        # В следующем кадре фон восстанавливается и выводится на весь экран
+        self._prev_drawn = [self.screen_rect]
+
     def handle_events(self):  # обработка ввода
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE:
-                    if self.game_status == 'game':
-                        self.bird.jump()
-                    elif self.game_status == 'menu':
-                        self.restart_game()
-
-            if event.type == self.spawn_wall_event and self.game_status == 'game':
-                self.wall_pairs.append(
-                    WallPair(self.width, self.height, self.config)
-                )
+        # Очередь SDL опрашивается один раз за кадр, дальше события только выбираются из неё
+        pygame.event.pump()
+
+        if pygame.event.get(pygame.QUIT, pump=False):
+            self.running = False
+
+        if pygame.event.get(self.expose_events, pump=False):
+            self.invalidate_screen()
+
+        for event in pygame.event.get(pygame.KEYDOWN, pump=False):
+            if event.key == pygame.K_SPACE:
+                if self.game_status == 'game':
+                    self.bird.jump()
+                elif self.game_status == 'menu':
+                    self.restart_game()
+
+        for _ in pygame.event.get(self.spawn_wall_event, pump=False):
+            if self.game_status == 'game':
+                self.spawn_wall_pair()
+
+    def spawn_wall_pair(self):
+        # Новая пара берётся из пула, если там есть свободная
+        wall_height = self.next_wall_height()
+        if self._wall_pool:
+            wall_pair = self._wall_pool.pop()
+            wall_pair.reset(self.width, wall_height)
+        else:
+            wall_pair = WallPair(
+                self.width, wall_height, self.height, self.config, self.wall_images, self._wall_pair_count
+            )
+            self._wall_pair_count += 1
+        self.wall_pairs.append(wall_pair)
+
+        if HAS_NUMBA:
+            slot = wall_pair.slot
+            if slot >= len(self.wall_x):
+                self._grow_wall_arrays()
+            self.wall_x[slot] = wall_pair.top_wall.x
+            self.wall_top_h[slot] = wall_pair.wall_height
+            self.wall_passed[slot] = False
+            self.wall_active[slot] = True
+
+    def next_wall_height(self):
+        # Случайная высота для стен: с NumPy берётся из заранее заполненного буфера
+        wall_config = self.config.wall
+        if np is None:
+            return random.randint(wall_config.min_height, wall_config.max_height)
+        if self._height_idx == len(self._height_pool):
+            self._height_pool = np.random.randint(
+                wall_config.min_height, wall_config.max_height + 1, WALL_HEIGHT_POOL_SIZE
+            ).tolist()
+            self._height_idx = 0
+        wall_height = self._height_pool[self._height_idx]
+        self._height_idx += 1
+        return wall_height
+
+    def _grow_wall_arrays(self):
+        # Удвоение ёмкости массивов состояния стен
+        size = len(self.wall_x)
+        self.wall_x = np.concatenate((self.wall_x, np.zeros(size, np.float64)))
+        self.wall_left = np.concatenate((self.wall_left, np.zeros(size, np.int64)))
+        self.wall_top_h = np.concatenate((self.wall_top_h, np.zeros(size, np.int32)))
+        self.wall_passed = np.concatenate((self.wall_passed, np.zeros(size, bool)))
+        self.wall_active = np.concatenate((self.wall_active, np.zeros(size, bool)))
 
     def update_game_logic(self):  # обновление логики
         if self.game_status == 'game':
+            if HAS_NUMBA:
+                # Птица и стены обновляются одним вызовом скомпилированной функции
+                self.update_compiled()
+                return
+
+            bird = self.bird
             # Обновление птицы
-            self.bird.update()
+            bird.update()
 
             # Проверка границ для птицы
-            bounds_result = self.bird.check_bounds(self.height)
-            if bounds_result == 'bottom':
+            if bird.check_bounds(self.height):
                 self.game_status = 'menu'
 
-            # Обновление и проверка стен
-            for wall_pair in self.wall_pairs[:]:
+            # Обновление и проверка стен (с конца, чтобы удалять перестановкой)
+            bird_rect = bird.rect
+            wall_pairs = self.wall_pairs
+            wall_pool = self._wall_pool
+            scored = 0
+            for i in range(len(wall_pairs) - 1, -1, -1):
+                wall_pair = wall_pairs[i]
                 wall_pair.update()
 
-                # Проверка столкновений
-                if wall_pair.check_collisions(self.bird.rect):
-                    self.game_status = 'menu'
-
                 # Проверка прохождения
-                if wall_pair.check_pass(self.bird.rect):
-                    self.score += 1  # +1 за пару стен
+                if wall_pair.check_pass(bird_rect):
+                    scored += 1  # +1 за пару стен
 
-                # Удаление стен за экраном
+                # Удаление стен за экраном: последняя пара встаёт на место ушедшей
                 if wall_pair.is_offscreen():
-                    self.wall_pairs.remove(wall_pair)
+                    wall_pairs[i] = wall_pairs[-1]
+                    wall_pairs.pop()
+                    wall_pool.append(wall_pair)
+            self.score += scored
+
+            # Проверка столкновений со всеми стенами одним вызовом
+            wall_rects = [rect for wall_pair in wall_pairs for _, rect in wall_pair.sprites]
+            if bird_rect.collidelist(wall_rects) >= 0:
+                self.game_status = 'menu'
+
+    def _tick_jit(self):
+        bird = self.bird
+        bird_rect = bird.rect
+        return tick(
+            bird.y_fp, bird.speed_y_fp, bird.gravity_fp,
+            bird_rect.x, bird_rect.width, bird_rect.height, self.height,
+            self.wall_x, self.wall_left, self.wall_top_h, self.wall_passed, self.wall_active, self.wall_speed,
+            self.wall_width, self.wall_full_height, self.wall_gap
+        )
+
+    def update_compiled(self):
+        bird = self.bird
+        bird.y_fp, bird.speed_y_fp, bird.rect.y, fell, collided, scored, offscreen = self._tick_jit()
+        self.apply_wall_tick(fell or collided, scored, offscreen)
+
+    def apply_wall_tick(self, collided, scored, offscreen):
+        # Применение результата шага стен к состоянию игры и прямоугольникам
+        if collided:
+            self.game_status = 'menu'
+        self.score += scored
+
+        # Удаление стен за экраном: с конца, последняя пара встаёт на место ушедшей
+        wall_pairs = self.wall_pairs
+        if offscreen.any():
+            self.wall_active &= ~offscreen
+            for i in range(len(wall_pairs) - 1, -1, -1):
+                wall_pair = wall_pairs[i]
+                if offscreen[wall_pair.slot]:
+                    wall_pairs[i] = wall_pairs[-1]
+                    wall_pairs.pop()
+                    self._wall_pool.append(wall_pair)
+
+        # Прямоугольники нужны только оставшимся на экране стенам.
+        # x берётся готовым из ядра: вызов скомпилированной to_pixel из Python дорог
+        wall_left = self.wall_left.tolist()
+        for wall_pair in wall_pairs:
+            x = wall_left[wall_pair.slot]
+            wall_pair.top_rect.x = x
+            wall_pair.bottom_rect.x = x
 
     def draw(self):
-        # Рисование фона
-        self.screen.blit(self.bg, (0, 0))
+        # Фон восстанавливается только там, где в прошлом кадре что-то было нарисовано
+        self.screen.blits([(self.bg, rect, rect) for rect in self._prev_drawn], doreturn=False)
 
         if self.game_status == 'game':
-            # Рисование стен
+            # Стены и птица рисуются одним пакетным вызовом
+            sprites = []
             for wall_pair in self.wall_pairs:
-                wall_pair.draw(self.screen)
+                sprites.extend(wall_pair.sprites)
+            sprites.append((self.bird.image, self.bird.rect))
 
-            # Рисование птицы
-            self.bird.draw(self.screen)
+            if HAS_FBLITS:
+                self.screen.fblits(sprites)
+            else:
+                self.screen.blits(sprites, doreturn=False)
+            # Копии, так как прямоугольники спрайтов изменятся в следующем кадре
+            drawn = [rect.clip(self.screen_rect) for _, rect in sprites]
 
             # Отображение счета
-            self.font.render_to(
-                self.screen,
-                (10, 10),
-                f'{self.score_text}{self.score}',
-                (255, 255, 255)
-            )
+            drawn.append(self.screen.blit(self.score_surface(), (10, 10)))
         else:
             # Экран проигрыша
-            self.font.render_to(
-                self.screen,
-                (self.width // 2 - 120, self.height // 2 - 50),
-                self.game_over_text,
-                (255, 0, 0)
-            )
-            self.font.render_to(
-                self.screen,
-                (self.width // 2 - 100, self.height // 2),
-                f'{self.score_text}{self.score}',
-                (255, 255, 255)
-            )
-            self.font.render_to(
-                self.screen,
-                (self.width // 2 - 200, self.height // 2 + 50),
-                self.restart_text,
-                (255, 255, 255)
-            )
+            drawn = [self.screen.blit(surface, pos) for surface, pos in self._static_surfs.values()]
+            drawn.append(self.screen.blit(self.score_surface(), self._menu_score_pos))
+
+        # Обновить нужно и новые позиции, и места, где спрайты были в прошлом кадре
+        self._dirty = drawn + self._prev_drawn
+        self._prev_drawn = drawn
+
+    def score_surface(self):
+        # Текст счёта рисуется один раз для каждого значения
+        surface = self._score_surf_cache.get(self.score)
+        if surface is None:
+            surface, _ = self.font.render(f'{self.score_text}{self.score}', (255, 255, 255))
+            self._score_surf_cache[self.score] = surface
+        return surface
+
+    def create_bird(self):
+        bird_config = self.config.bird
+        start_y = bird_config.start_y if bird_config.start_y is not None else self.height // 2
+        return Bird(bird_config.start_x, start_y, self.config)
 
     def restart_game(self):
         self.game_status = 'game'
-        bird_config = self.config.get('bird_settings')
-        start_x = bird_config.get('start_x', 100)
-        start_y = bird_config.get('start_y', self.height // 2)
-        self.bird = Bird(start_x, start_y, self.config)
-        self.wall_pairs = []
+        self.bird = self.create_bird()
+        self._wall_pool.extend(self.wall_pairs)
+        self.wall_pairs.clear()
+        if HAS_NUMBA:
+            self.wall_active[:] = False
         self.score = 0
 
     def run(self):
@@ -332,7 +645,7 @@ class Game:  # Главный класс, управляющий всей игр
             self.update_game_logic()
             self.draw()
 
-            pygame.display.flip()
+            pygame.display.update(self._dirty)
             self.clock.tick(self.fps)
 
         pygame.quit()
@@ -0,0 +1,87 @@
+import os
+import random
+import unittest
+from unittest import mock
+
+# Окно не нужно: тесты работают без дисплея
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame  # noqa: E402
+import flappy_bird  # noqa: E402
+
+GAME_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def replay(use_numba, wall_speed, frames=3000, seed=1):
+    # Прогон игры с автопилотом и фиксированными высотами стен.
+    # Возвращает покадровый след: статус, счёт, y птицы и прямоугольники стен
+    with mock.patch.object(flappy_bird, 'HAS_NUMBA', use_numba):
+        game = flappy_bird.Game()
+        pygame.time.set_timer(game.spawn_wall_event, 0)
+        game.config.wall.speed = game.wall_speed = wall_speed
+
+        wall_config = game.config.wall
+        heights = random.Random(seed)
+        game.next_wall_height = lambda: heights.randint(wall_config.min_height, wall_config.max_height)
+
+        # Стены появляются через равные 180 пикселей пути при любой скорости
+        spawn_every = round(180 / wall_speed)
+        trace = []
+        last_jump = -100
+        for frame in range(frames):
+            if frame % spawn_every == 0:
+                pygame.event.post(pygame.event.Event(game.spawn_wall_event))
+
+            # Прыжок, когда птица ниже середины проёма ближайшей стены
+            bird_rect = game.bird.rect
+            target = game.height // 2
+            ahead = [wp for wp in game.wall_pairs if wp.top_rect.right > bird_rect.left]
+            if ahead:
+                target = min(ahead, key=lambda wp: wp.top_rect.x).top_rect.bottom + 120
+            if game.game_status == 'menu' or (bird_rect.centery > target and frame - last_jump > 12):
+                last_jump = frame
+                pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+
+            game.handle_events()
+            game.update_game_logic()
+
+            walls = sorted(tuple(wp.top_rect) + tuple(wp.bottom_rect) for wp in game.wall_pairs)
+            trace.append((game.game_status, game.score, game.bird.rect.y, walls))
+        return trace
+
+
+class ReplayTest(unittest.TestCase):
+    # Скомпилированный шаг и поштучная обработка стен должны давать одинаковую игру
+
+    def setUp(self):
+        cwd = os.getcwd()
+        os.chdir(GAME_DIR)
+        self.addCleanup(os.chdir, cwd)
+        self.addCleanup(pygame.quit)
+
+    def check_speed(self, wall_speed):
+        objects = replay(False, wall_speed)
+
+        # След не должен быть вырожденным: есть и пройденные стены, и проигрыши
+        self.assertGreater(max(score for _, score, _, _ in objects), 0)
+        self.assertIn('menu', {status for status, _, _, _ in objects})
+
+        if not flappy_bird.HAS_NUMBA:
+            self.skipTest('Numba не установлена')
+        compiled = replay(True, wall_speed)
+        for frame, (expected, actual) in enumerate(zip(objects, compiled)):
+            self.assertEqual(expected, actual, f'кадр {frame}')
+
+    def test_integer_speed(self):
+        self.check_speed(2)
+
+    def test_fractional_speed(self):
+        self.check_speed(1.3)
+
+    def test_half_pixel_speed(self):
+        self.check_speed(0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()